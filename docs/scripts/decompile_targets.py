@@ -0,0 +1,48 @@
+# Ghidra headless script to decompile several FF3 target sets in one run
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+# The IL2CPP header and script.json symbols are processed once for all sets
+#
+# Usage: -postScript decompile_targets.py [magic] [pathfinding]
+#   The target sets are positional arguments (analyzeHeadless rejects script
+#   args starting with "-"). cmd.exe splits on "," and "=", so every argument is
+#   read and "magic,pathfinding" or "targets=magic,pathfinding" also work.
+#   Defaults to every known target set.
+
+from ff3_decompile_common import run_decompile
+from decompile_magic import MAGIC_JOB
+from decompile_pathfinding import PATHFINDING_JOB
+
+# Target set name -> job, in the order they are decompiled
+JOB_NAMES = ["magic", "pathfinding"]
+JOBS = {
+    "magic": MAGIC_JOB,
+    "pathfinding": PATHFINDING_JOB,
+}
+
+def parse_target_names(args):
+    """Return the target set names from every script argument, or all of them."""
+    names = []
+    for arg in args:
+        arg = arg.strip().lower()
+        if arg.startswith("targets="):
+            arg = arg[len("targets="):]
+        for name in arg.split(","):
+            name = name.strip()
+            # A bare "targets" is what cmd.exe leaves of "targets=..."
+            if name and name != "targets" and name not in names:
+                names.append(name)
+    return names or JOB_NAMES
+
+def run():
+    """Main script entry point."""
+    names = parse_target_names(getScriptArgs())
+    unknown = [name for name in names if name not in JOBS]
+    if unknown:
+        print("ERROR: Unknown target set(s): " + ", ".join(unknown))
+        print("Valid target sets: " + ", ".join(JOB_NAMES))
+        return
+
+    run_decompile(getCurrentProgram(), [JOBS[name] for name in names])
+
+# Run the script
+run()
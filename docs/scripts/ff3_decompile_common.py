@@ -0,0 +1,658 @@
+# Shared code for the FF3 Ghidra headless decompile scripts
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+# Parses il2cpp.h for type information, applies script.json symbols, then
+# decompiles one or more target sets (see DecompileJob) in a single run
+
+from ghidra.app.decompiler import DecompileOptions
+from ghidra.app.decompiler import DecompInterface
+from ghidra.app.util.cparser.C import CParserUtils
+from ghidra.framework import Application
+from ghidra.program.model.data import DataTypeConflictHandler
+from ghidra.program.model.data import DataTypeManager
+from ghidra.program.model.data import FileDataTypeManager
+from ghidra.program.model.data import StandaloneDataTypeManager
+from ghidra.util.task import ConsoleTaskMonitor
+from ghidra.program.model.symbol import SourceType
+from ghidra.program.flatapi import FlatProgramAPI
+from java.io import File
+from java.lang import Runtime
+from java.lang import String
+from java.lang import ThreadLocal
+from java.util import ArrayList
+from java.util.concurrent import Callable
+from java.util.concurrent import Executors
+from java.util.concurrent import TimeUnit
+from jarray import array
+from jarray import zeros
+import codecs
+import hashlib
+import io
+import json
+import os
+import threading
+import traceback
+
+# Paths
+SCRIPT_JSON_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff3\\script.json"
+IL2CPP_HEADER_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff3\\il2cpp_ghidra.h"
+# Parsed types are cached here so warm runs skip the C parser entirely
+IL2CPP_HEADER_CACHE_PATH = IL2CPP_HEADER_PATH + ".gdt"
+
+# Decompiled C is cached here, one file per function, keyed by its bytes
+DECOMPILE_CACHE_DIR = "D:\\Games\\Dev\\Unity\\FFPR\\ff3\\decompile_cache"
+
+# script.json is read in chunks of this many characters
+SCRIPT_JSON_CHUNK_SIZE = 1048576
+# A ScriptMethod entry that still fails to decode with this much input left is malformed
+SCRIPT_JSON_MAX_ENTRY_SIZE = 65536
+
+# Output is streamed through a buffer this large rather than joined in memory
+OUTPUT_BUFFER_SIZE = 262144
+
+# Settings applied to every pooled decompiler; also part of the decompile cache key
+DECOMPILE_SIMPLIFICATION_STYLE = "decompile"
+DECOMPILE_ELIMINATE_UNREACHABLE = True
+DECOMPILER_FINGERPRINT = "style={};eliminateUnreachable={};c=True;syntaxTree=False".format(
+    DECOMPILE_SIMPLIFICATION_STYLE, DECOMPILE_ELIMINATE_UNREACHABLE)
+
+# Decompile timeouts in seconds - a short first attempt, then one longer retry on timeout
+DECOMPILE_TIMEOUT = 30
+DECOMPILE_RETRY_TIMEOUT = 120
+
+# Set FF3_DECOMPILE_DEBUG=1 to print full tracebacks for header parse failures
+DEBUG = bool(os.environ.get("FF3_DECOMPILE_DEBUG"))
+
+# Upper bound on decompiler worker threads (each runs its own decompiler process)
+MAX_DECOMPILE_WORKERS = 8
+# Seconds to wait for interrupted workers to stop before their decompilers are disposed
+POOL_SHUTDOWN_TIMEOUT = DECOMPILE_RETRY_TIMEOUT
+
+def count_data_types(dtm):
+    """Return the number of data types in dtm."""
+    if hasattr(dtm, "getDataTypeCount"):
+        return dtm.getDataTypeCount(True)
+    # Older Ghidra without getDataTypeCount - walk the iterator
+    iterator = dtm.getAllDataTypes()
+    count = 0
+    while iterator.hasNext():
+        iterator.next()
+        count += 1
+    return count
+
+def copy_archive_types(archive, dtm):
+    """Copy every type in the header archive into the program's data type manager."""
+    types = ArrayList()
+    archive.getAllDataTypes(types)
+    tx = dtm.startTransaction("Load IL2CPP type archive")
+    try:
+        dtm.addDataTypes(types, DataTypeConflictHandler.REPLACE_HANDLER, ConsoleTaskMonitor())
+    finally:
+        dtm.endTransaction(tx, True)
+    return types.size()
+
+def load_cached_header_types(dtm):
+    """Load types from the .gdt archive if it is newer than il2cpp_ghidra.h."""
+    if not os.path.exists(IL2CPP_HEADER_CACHE_PATH):
+        return False
+    if os.path.getmtime(IL2CPP_HEADER_CACHE_PATH) < os.path.getmtime(IL2CPP_HEADER_PATH):
+        print("Type archive is older than header - reparsing")
+        return False
+
+    print("Loading cached types from: " + IL2CPP_HEADER_CACHE_PATH)
+    try:
+        archive = FileDataTypeManager.openFileArchive(File(IL2CPP_HEADER_CACHE_PATH), False)
+        try:
+            count = copy_archive_types(archive, dtm)
+        finally:
+            archive.close()
+        print("Loaded " + str(count) + " types from archive")
+        return True
+    except Exception as e:
+        print("Could not load type archive, reparsing: " + str(e))
+        return False
+
+def create_header_archive(program):
+    """Create an empty .gdt archive using the program's architecture (pointer sizes etc.)."""
+    # createFileArchive refuses to overwrite an existing file
+    if os.path.exists(IL2CPP_HEADER_CACHE_PATH):
+        os.remove(IL2CPP_HEADER_CACHE_PATH)
+    archive = FileDataTypeManager.createFileArchive(File(IL2CPP_HEADER_CACHE_PATH))
+    if hasattr(archive, "setProgramArchitecture"):
+        archive.setProgramArchitecture(program.getLanguage(),
+                                       program.getCompilerSpec().getCompilerSpecID(),
+                                       StandaloneDataTypeManager.LanguageUpdateOption.CLEAR,
+                                       ConsoleTaskMonitor())
+    return archive
+
+def parse_il2cpp_header(program):
+    """Parse il2cpp_ghidra.h and apply types to the program's data type manager.
+
+    The header is parsed into the .gdt archive, which is then copied into the
+    program, so cold and warm runs apply exactly the same set of types.
+    """
+    if not os.path.exists(IL2CPP_HEADER_PATH):
+        print("WARNING: il2cpp_ghidra.h not found at: " + IL2CPP_HEADER_PATH)
+        return False
+
+    # Get the program's data type manager
+    dtm = program.getDataTypeManager()
+
+    # Warm path: reuse the archive from a previous parse of the same header
+    if load_cached_header_types(dtm):
+        return True
+
+    print("Parsing IL2CPP header: " + IL2CPP_HEADER_PATH)
+    print("Header size: " + str(os.path.getsize(IL2CPP_HEADER_PATH)) + " bytes")
+    print("This may take a few minutes for large headers...")
+
+    archive = None
+    saved = False
+    try:
+        archive = create_header_archive(program)
+
+        # parseHeaderFiles reads the header from disk itself, so the file is
+        # never held in memory as a Python string. It takes Java String[] args.
+        open_dtms = array([], DataTypeManager)
+        file_names = array([IL2CPP_HEADER_PATH], String)
+        include_paths = array([], String)
+        parser_args = array([], String)
+
+        print("Starting C parser...")
+        tx = archive.startTransaction("Parse IL2CPP header")
+        try:
+            parse_results = CParserUtils.parseHeaderFiles(open_dtms, file_names, include_paths, parser_args,
+                                                          archive, ConsoleTaskMonitor())
+        finally:
+            archive.endTransaction(tx, True)
+
+        if parse_results is not None and not parse_results.successful():
+            print("C Parser error: " + str(parse_results.cParseMessages()))
+            print("This may be a syntax error in the header file.")
+            print("Consider editing il2cpp_ghidra.h to fix or comment out the problematic section.")
+            return False
+
+        print("Parsing completed, " + str(count_data_types(archive)) + " types in header")
+        print("Caching parsed types to: " + IL2CPP_HEADER_CACHE_PATH)
+        archive.save()
+        saved = True
+
+        copy_archive_types(archive, dtm)
+        print("Data type manager now has " + str(count_data_types(dtm)) + " types")
+        return True
+
+    except Exception as e:
+        print("Error parsing il2cpp_ghidra.h: " + str(e))
+        if DEBUG:
+            traceback.print_exc()
+        return False
+    finally:
+        if archive is not None:
+            archive.close()
+        # A partial archive would look newer than the header and be loaded next run
+        if not saved and os.path.exists(IL2CPP_HEADER_CACHE_PATH):
+            os.remove(IL2CPP_HEADER_CACHE_PATH)
+
+def iter_script_methods(f):
+    """Yield script.json ScriptMethod entries one at a time without loading the whole file."""
+    decoder = json.JSONDecoder()
+    key = '"ScriptMethod"'
+
+    # Read forward to the opening bracket of the ScriptMethod array
+    buf = u""
+    while True:
+        chunk = f.read(SCRIPT_JSON_CHUNK_SIZE)
+        if not chunk:
+            return
+        buf += chunk
+        key_pos = buf.find(key)
+        if key_pos < 0:
+            # Keep a tail in case the key straddles two chunks
+            buf = buf[-len(key):]
+            continue
+        bracket = buf.find("[", key_pos)
+        if bracket >= 0:
+            buf = buf[bracket + 1:]
+            break
+
+    # Decode one element at a time, refilling the buffer when an element is cut off
+    pos = 0
+    eof = False
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buf) and buf[pos] == "]":
+            return
+        try:
+            if pos >= len(buf):
+                raise ValueError("buffer exhausted")
+            method, pos = decoder.raw_decode(buf, pos)
+        except ValueError:
+            # Only an entry cut off at the end of the buffer is worth more input;
+            # anything else is a corrupt file and is reported to the caller
+            if len(buf) - pos > SCRIPT_JSON_MAX_ENTRY_SIZE:
+                raise
+            if eof:
+                if pos < len(buf):
+                    raise
+                raise ValueError("script.json ended inside the ScriptMethod array")
+            chunk = f.read(SCRIPT_JSON_CHUNK_SIZE)
+            if not chunk:
+                eof = True
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+        yield method
+
+def apply_il2cpp_symbols(program, targets_by_rva):
+    """Apply IL2CPP symbol names from script.json for the given RVA -> name targets."""
+    if not os.path.exists(SCRIPT_JSON_PATH):
+        print("script.json not found at: " + SCRIPT_JSON_PATH)
+        return 0
+
+    print("Loading IL2CPP symbols from: " + SCRIPT_JSON_PATH)
+    try:
+        symbol_table = program.getSymbolTable()
+        space = program.getAddressFactory().getDefaultAddressSpace()
+        image_base = program.getImageBase().getOffset()
+        applied = 0
+
+        # Target name -> RVAs, plus the "Class.Method" spelling of each name, for O(1)
+        # lookup. Overloads share a name, so an entry only counts at a target RVA.
+        targets = {}
+        for rva, name in targets_by_rva.items():
+            targets.setdefault(name, set()).add(rva)
+        targets_dotted = dict((n.replace("$$", "."), n) for n in targets if "." not in n)
+        # Stop reading script.json once every target RVA has been labeled
+        unmatched = set(targets_by_rva)
+
+        # One transaction for every label, with change events muted until it closes
+        tx = program.startTransaction("apply_il2cpp_symbols")
+        try:
+            program.setEventsEnabled(False)
+            with codecs.open(SCRIPT_JSON_PATH, 'r', 'utf-8') as f:
+                for method in iter_script_methods(f):
+                    addr = method.get("Address")
+                    name = method.get("Name")
+                    if not addr or not name:
+                        continue
+                    match = name if name in targets else targets_dotted.get(name)
+                    if match is None or addr not in targets[match]:
+                        continue
+                    try:
+                        ghidra_addr = space.getAddress(image_base + addr)
+                        clean_name = name.replace("$$", "__").replace("<", "_").replace(">", "_").replace(",", "_")
+                        symbol_table.createLabel(ghidra_addr, clean_name, SourceType.IMPORTED)
+                        applied += 1
+                    except Exception as e:
+                        pass
+                    unmatched.discard(addr)
+                    if not unmatched:
+                        break
+        finally:
+            try:
+                program.setEventsEnabled(True)
+            finally:
+                program.endTransaction(tx, True)
+
+        print("Applied " + str(applied) + " IL2CPP symbols")
+        return applied
+    except Exception as e:
+        print("Error loading script.json: " + str(e))
+        return 0
+
+def decompile_cache_path(program, func, name, types_parsed):
+    """Return the cache file for func, or None if no key could be built.
+
+    The key covers everything that changes the C output: the function bytes and
+    name, the Ghidra version, decompiler settings, whether header types were
+    applied this run, and the header and script.json (callee labels) mtimes.
+    """
+    try:
+        key = hashlib.sha1()
+        key.update(str(Application.getApplicationVersion()))
+        key.update("\0" + name + "\0")
+        key.update(DECOMPILER_FINGERPRINT + "\0")
+        key.update("types=" + str(bool(types_parsed)) + "\0")
+        for path in (IL2CPP_HEADER_PATH, SCRIPT_JSON_PATH):
+            if os.path.exists(path):
+                key.update(path + "=" + str(os.path.getmtime(path)) + "\0")
+        memory = program.getMemory()
+        for addr_range in func.getBody():
+            buf = zeros(int(addr_range.getLength()), 'b')
+            memory.getBytes(addr_range.getMinAddress(), buf)
+            key.update(buf.tostring())
+        return os.path.join(DECOMPILE_CACHE_DIR, key.hexdigest() + ".c")
+    except Exception as e:
+        # The cache is optional - e.g. uninitialized bytes just mean an uncached decompile
+        print("    Decompile cache disabled for " + name + ": " + str(e))
+        return None
+
+def read_decompile_cache(cache_path):
+    """Return cached C for cache_path, or None on a miss or unreadable entry."""
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    try:
+        with codecs.open(cache_path, 'r', 'utf-8') as f:
+            return f.read()
+    except Exception as e:
+        print("WARNING: Could not read decompile cache: " + str(e))
+        return None
+
+def write_decompile_cache(cache_path, code):
+    """Write decompiled C to the cache via a temp file and rename."""
+    tmp_path = cache_path + "." + threading.current_thread().name + ".tmp"
+    try:
+        if not os.path.isdir(DECOMPILE_CACHE_DIR):
+            os.makedirs(DECOMPILE_CACHE_DIR)
+        with codecs.open(tmp_path, 'w', 'utf-8') as f:
+            f.write(code)
+        os.rename(tmp_path, cache_path)
+    except Exception as e:
+        # Another worker may have created the directory or entry first
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if not os.path.exists(cache_path):
+            print("WARNING: Could not write decompile cache: " + str(e))
+
+def prepare_target_functions(program, space, image_base, jobs):
+    """Look up or create every target function before any decompiling starts.
+
+    Runs serially on the main thread so each caller is decompiled against the same
+    set of functions every run. Returns RVA -> (function, error).
+    """
+    functions = {}
+    flat_api = FlatProgramAPI(program)
+    function_manager = program.getFunctionManager()
+    tx = program.startTransaction("Create target functions")
+    try:
+        for job in jobs:
+            for rva, name in job.targets_sorted:
+                if rva in functions:
+                    continue
+                abs_addr = image_base + rva
+                try:
+                    ghidra_addr = space.getAddress(abs_addr)
+                    func = function_manager.getFunctionAt(ghidra_addr)
+                    if func is None:
+                        print("    Creating function at 0x{:X}...".format(abs_addr))
+                        func = flat_api.createFunction(ghidra_addr, name.replace("$$", "_"))
+                    if func is None:
+                        functions[rva] = (None, "Could not create function at 0x{:X}".format(abs_addr))
+                    else:
+                        functions[rva] = (func, None)
+                except Exception as e:
+                    functions[rva] = (None, "Exception: " + str(e))
+    finally:
+        program.endTransaction(tx, True)
+    return functions
+
+def decompile_function(decompiler, func, cache_path):
+    """Decompile an existing function and return C code, storing it at cache_path if given."""
+    try:
+        results = decompiler.decompileFunction(func, DECOMPILE_TIMEOUT, ConsoleTaskMonitor())
+        if not results.decompileCompleted() and results.isTimedOut():
+            # Only timeouts get the longer attempt; other failures are permanent, so fail fast
+            results = decompiler.decompileFunction(func, DECOMPILE_RETRY_TIMEOUT, ConsoleTaskMonitor())
+
+        if results.decompileCompleted():
+            decomp_func = results.getDecompiledFunction()
+            if decomp_func:
+                code = decomp_func.getC()
+                if cache_path is not None:
+                    write_decompile_cache(cache_path, code)
+                return code, None
+            else:
+                return None, "Decompilation returned no result"
+        else:
+            error_msg = results.getErrorMessage()
+            if error_msg:
+                return None, "Decompilation failed: " + str(error_msg)
+            else:
+                return None, "Decompilation failed (unknown error)"
+
+    except Exception as e:
+        return None, "Exception: " + str(e)
+
+class DecompilerPool(ThreadLocal):
+    """Hands each worker thread its own DecompInterface; all are disposed together."""
+    def __init__(self, program):
+        ThreadLocal.__init__(self)
+        self.program = program
+        self.created = []
+        self.created_lock = threading.Lock()
+
+    def initialValue(self):
+        decompiler = DecompInterface()
+        decompiler.openProgram(self.program)
+
+        # Only C output is used, so skip the syntax tree
+        options = DecompileOptions()
+        options.grabFromProgram(self.program)
+        options.setEliminateUnreachable(DECOMPILE_ELIMINATE_UNREACHABLE)
+        decompiler.setOptions(options)
+        decompiler.setSimplificationStyle(DECOMPILE_SIMPLIFICATION_STYLE)
+        decompiler.toggleCCode(True)
+        decompiler.toggleSyntaxTree(False)
+        with self.created_lock:
+            self.created.append(decompiler)
+        return decompiler
+
+    def dispose(self):
+        for decompiler in self.created:
+            decompiler.dispose()
+
+class DecompileTask(Callable):
+    """Decompiles one prepared function on a pool thread, returning (code, error)."""
+    def __init__(self, decompilers, func, cache_path):
+        self.decompilers = decompilers
+        self.func = func
+        self.cache_path = cache_path
+
+    def call(self):
+        return decompile_function(self.decompilers.get(), self.func, self.cache_path)
+
+class DecompileJob(object):
+    """One target set: the functions to decompile and the file their C output goes to."""
+    def __init__(self, title, targets, output_path, notes=(), group_by_class=False):
+        self.title = title
+        self.targets = targets                  # RVA -> IL2CPP method name
+        self.output_path = output_path
+        self.notes = notes                      # extra lines for the output header comment
+        self.group_by_class = group_by_class    # sort by name and emit a banner per class
+        # Sorted once here (jobs are built at module load) rather than on every run
+        if group_by_class:
+            self.targets_sorted = sorted(targets.items(), key=lambda x: x[1])
+        else:
+            self.targets_sorted = sorted(targets.items())
+
+def write_job_output(out, job, program, pool, decompilers, functions, image_base, types_parsed):
+    """Decompile one job's targets on the shared pool, writing C to out; returns (success, fail)."""
+    out.write("/*\n")
+    out.write(" * FF3 Decompiled Functions - " + job.title + "\n")
+    out.write(" * Generated by Ghidra headless analysis\n")
+    out.write(" * Program: " + program.getName() + "\n")
+    out.write(" * Image Base: 0x{:X}".format(image_base) + "\n")
+    out.write(" * IL2CPP types applied: " + str(types_parsed) + "\n")
+    for note in job.notes:
+        out.write(" *" + (" " + note if note else "") + "\n")
+    out.write(" */\n")
+    out.write("\n")
+
+    success_count = 0
+    fail_count = 0
+
+    # Only cache misses reach the pool, so a warm run never starts a decompiler;
+    # targets without a function fail here
+    pending = []
+    for rva, name in job.targets_sorted:
+        func, error = functions[rva]
+        future = None
+        code = None
+        if func is not None:
+            cache_path = decompile_cache_path(program, func, name, types_parsed)
+            code = read_decompile_cache(cache_path)
+            if code is None:
+                future = pool.submit(DecompileTask(decompilers, func, cache_path))
+        pending.append((rva, name, future, code, error))
+
+    # Collect in submission order so the output layout is deterministic
+    current_class = ""
+    for rva, name, future, code, error in pending:
+        if future is not None:
+            code, error = future.get()
+        abs_addr = image_base + rva
+
+        # Group functions by class for better organization
+        if job.group_by_class:
+            class_name = name.split("$$")[0] if "$$" in name else "Unknown"
+            if class_name != current_class:
+                current_class = class_name
+                out.write("\n")
+                out.write("/" + "=" * 68 + "/\n")
+                out.write("/* " + class_name + "\n")
+                out.write(" " + "=" * 67 + "/\n")
+
+        print("")
+        print("Decompiling: " + name)
+        print("  RVA: 0x{:X} -> Absolute: 0x{:X}".format(rva, abs_addr))
+
+        out.write("\n")
+        out.write("/" + "*" * 68 + "/\n")
+        out.write("/* " + name + "\n")
+        out.write(" * RVA: 0x{:X}".format(rva) + "\n")
+        out.write(" * Address: 0x{:X}".format(abs_addr) + "\n")
+        out.write(" " + "*" * 67 + "/\n")
+        out.write("\n")
+
+        if code:
+            out.write(code + "\n")
+            print("  SUCCESS")
+            success_count += 1
+        else:
+            out.write("/* DECOMPILATION FAILED: " + str(error) + " */\n")
+            print("  FAILED: " + str(error))
+            fail_count += 1
+
+    return success_count, fail_count
+
+def decompile_job(job, program, pool, decompilers, functions, image_base, types_parsed):
+    """Decompile one job and replace its output file only once the job has finished."""
+    print("")
+    print("Job: " + job.title + " -> " + job.output_path)
+    # Written beside the real output so a failed run leaves the previous file intact
+    tmp_path = job.output_path + ".tmp"
+    try:
+        out = codecs.getwriter('utf-8')(io.open(tmp_path, 'wb', buffering=OUTPUT_BUFFER_SIZE))
+    except Exception as e:
+        print("ERROR opening output file: " + str(e))
+        return
+
+    completed = False
+    try:
+        success_count, fail_count = write_job_output(out, job, program, pool, decompilers, functions,
+                                                     image_base, types_parsed)
+        out.close()
+        completed = True
+    except Exception as e:
+        print("ERROR writing output file: " + str(e))
+    finally:
+        if not completed:
+            try:
+                out.close()
+            except Exception:
+                pass
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    if not completed:
+        print("Previous output left unchanged: " + job.output_path)
+        return
+
+    # Replace the previous output. os.rename will not overwrite on Windows, so the old
+    # file is moved aside first and restored if the new one cannot take its place.
+    print("")
+    print("=" * 70)
+    backup_path = job.output_path + ".bak"
+    try:
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+        if os.path.exists(job.output_path):
+            os.rename(job.output_path, backup_path)
+        try:
+            os.rename(tmp_path, job.output_path)
+        except Exception:
+            if os.path.exists(backup_path):
+                os.rename(backup_path, job.output_path)
+            raise
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+        print("Decompilation complete!")
+        print("  Success: " + str(success_count))
+        print("  Failed:  " + str(fail_count))
+        print("  Output:  " + job.output_path)
+    except Exception as e:
+        print("ERROR writing output file: " + str(e))
+        if os.path.exists(tmp_path):
+            print("  New output kept at: " + tmp_path)
+        if os.path.exists(backup_path):
+            print("  Previous output kept at: " + backup_path)
+
+    print("=" * 70)
+
+def run_decompile(program, jobs):
+    """Run STEPs 1-2 once for the program, then STEP 3 for each job."""
+    print("=" * 70)
+    print("FF3 " + " + ".join(job.title for job in jobs) + " Decompiler")
+    print("=" * 70)
+
+    if program is None:
+        print("ERROR: No program loaded!")
+        return
+
+    image_base = program.getImageBase().getOffset()
+    space = program.getAddressFactory().getDefaultAddressSpace()
+    print("Program: " + program.getName())
+    print("Image Base: 0x{:X}".format(image_base))
+    for job in jobs:
+        print("Output: " + job.output_path)
+    print("")
+
+    # Step 1: Parse IL2CPP header for type information
+    print("-" * 70)
+    print("STEP 1: Parsing IL2CPP type definitions")
+    print("-" * 70)
+    types_parsed = parse_il2cpp_header(program)
+    if types_parsed:
+        print("Type parsing completed successfully")
+    else:
+        print("Type parsing failed or skipped - decompilation will use generic types")
+    print("")
+
+    # Step 2: Apply symbol names from script.json
+    print("-" * 70)
+    print("STEP 2: Applying IL2CPP symbol names")
+    print("-" * 70)
+    targets_by_rva = {}
+    for job in jobs:
+        targets_by_rva.update(job.targets)
+    apply_il2cpp_symbols(program, targets_by_rva)
+    print("")
+
+    # Step 3: Decompile target functions
+    print("-" * 70)
+    print("STEP 3: Decompiling target functions")
+    print("-" * 70)
+    target_count = sum(len(job.targets) for job in jobs)
+    workers = max(1, min(MAX_DECOMPILE_WORKERS, Runtime.getRuntime().availableProcessors(), target_count))
+    print("Initializing decompiler pool (" + str(workers) + " workers)...")
+    functions = prepare_target_functions(program, space, image_base, jobs)
+    decompilers = DecompilerPool(program)
+    pool = Executors.newFixedThreadPool(workers)
+
+    try:
+        for job in jobs:
+            decompile_job(job, program, pool, decompilers, functions, image_base, types_parsed)
+    finally:
+        pool.shutdownNow()
+        if not pool.awaitTermination(POOL_SHUTDOWN_TIMEOUT, TimeUnit.SECONDS):
+            print("WARNING: Decompiler workers still running after " + str(POOL_SHUTDOWN_TIMEOUT) + "s")
+        decompilers.dispose()
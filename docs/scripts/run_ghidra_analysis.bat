@@ -6,6 +6,7 @@ REM Usage: run_ghidra_analysis.bat [script] [mode]
 REM   script:
 REM     pathfinding - Decompile pathfinding functions (default)
 REM     magic       - Decompile magic/ability menu functions
+REM     all         - Decompile every target set in one run (header parsed once)
 REM   mode:
 REM     import  - Create new project and import GameAssembly.dll (first time)
 REM     analyze - Re-run analysis on existing project (subsequent runs)
@@ -14,6 +15,7 @@ REM Examples:
 REM   run_ghidra_analysis.bat                    - Import + decompile pathfinding
 REM   run_ghidra_analysis.bat magic              - Import + decompile magic
 REM   run_ghidra_analysis.bat magic analyze      - Re-analyze existing project for magic
+REM   run_ghidra_analysis.bat all analyze        - Re-analyze existing project for all sets
 REM   run_ghidra_analysis.bat pathfinding analyze
 
 setlocal enabledelayedexpansion
@@ -38,6 +40,7 @@ set "MODE=import"
 REM First arg: script type
 if /i "%~1"=="magic" set "SCRIPT_TYPE=magic"
 if /i "%~1"=="pathfinding" set "SCRIPT_TYPE=pathfinding"
+if /i "%~1"=="all" set "SCRIPT_TYPE=all"
 if /i "%~1"=="analyze" (
     set "MODE=analyze"
     goto :skip_second_arg
@@ -55,13 +58,21 @@ if /i "%~2"=="import" set "MODE=import"
 :skip_second_arg
 
 REM Set script-specific variables
-if "%SCRIPT_TYPE%"=="magic" (
+set "SCRIPT_ARGS="
+if "%SCRIPT_TYPE%"=="all" (
+    set "SCRIPT_FILE=%SCRIPT_DIR%decompile_targets.py"
+    set "OUTPUT_FILES="%SCRIPT_DIR%decompiled_magic.c" "%SCRIPT_DIR%decompiled_pathfinding.c""
+    set "SCRIPT_NAME=decompile_targets.py"
+    REM analyzeHeadless drops script args starting with "-", and cmd.exe splits on
+    REM "," and "=", so pass the sets as separate positional args
+    set "SCRIPT_ARGS=magic pathfinding"
+) else if "%SCRIPT_TYPE%"=="magic" (
     set "SCRIPT_FILE=%SCRIPT_DIR%decompile_magic.py"
-    set "OUTPUT_FILE=%SCRIPT_DIR%decompiled_magic.c"
+    set "OUTPUT_FILES="%SCRIPT_DIR%decompiled_magic.c""
     set "SCRIPT_NAME=decompile_magic.py"
 ) else (
     set "SCRIPT_FILE=%SCRIPT_DIR%decompile_pathfinding.py"
-    set "OUTPUT_FILE=%SCRIPT_DIR%decompiled_pathfinding.c"
+    set "OUTPUT_FILES="%SCRIPT_DIR%decompiled_pathfinding.c""
     set "SCRIPT_NAME=decompile_pathfinding.py"
 )
 
@@ -94,7 +105,7 @@ echo   Project:        %PROJECT_DIR%\%PROJECT_NAME%
 echo   GameAssembly:   %GAME_ASSEMBLY%
 echo   Script Type:    %SCRIPT_TYPE%
 echo   Script:         %SCRIPT_FILE%
-echo   Output:         %OUTPUT_FILE%
+echo   Output:         %OUTPUT_FILES%
 echo   Log:            %LOG_FILE%
 echo   Mode:           %MODE%
 echo.
@@ -121,14 +132,14 @@ if "%MODE%"=="import" (
     echo.
 
     REM Import mode - all on one line to avoid CMD parsing issues
-    call "%GHIDRA_HOME%\support\analyzeHeadless.bat" "%PROJECT_DIR%" "%PROJECT_NAME%" -import "%GAME_ASSEMBLY%" -overwrite -scriptPath "%SCRIPT_DIR_CLEAN%" -postScript %SCRIPT_NAME% >> "%LOG_FILE%" 2>&1
+    call "%GHIDRA_HOME%\support\analyzeHeadless.bat" "%PROJECT_DIR%" "%PROJECT_NAME%" -import "%GAME_ASSEMBLY%" -overwrite -scriptPath "%SCRIPT_DIR_CLEAN%" -postScript %SCRIPT_NAME% %SCRIPT_ARGS% >> "%LOG_FILE%" 2>&1
 
 ) else (
     echo Running: Re-analyze existing project
     echo.
 
     REM Analyze mode - use -noanalysis since already analyzed, just run script
-    call "%GHIDRA_HOME%\support\analyzeHeadless.bat" "%PROJECT_DIR%" "%PROJECT_NAME%" -process "GameAssembly.dll" -noanalysis -scriptPath "%SCRIPT_DIR_CLEAN%" -postScript %SCRIPT_NAME% >> "%LOG_FILE%" 2>&1
+    call "%GHIDRA_HOME%\support\analyzeHeadless.bat" "%PROJECT_DIR%" "%PROJECT_NAME%" -process "GameAssembly.dll" -noanalysis -scriptPath "%SCRIPT_DIR_CLEAN%" -postScript %SCRIPT_NAME% %SCRIPT_ARGS% >> "%LOG_FILE%" 2>&1
 )
 
 set "EXIT_CODE=%ERRORLEVEL%"
@@ -143,16 +154,17 @@ echo ======================================================================
 
 if %EXIT_CODE%==0 (
     echo Analysis completed successfully!
-    if exist "%OUTPUT_FILE%" (
-        echo.
-        echo Decompiled output written to:
-        echo   %OUTPUT_FILE%
-        echo.
-        for %%A in ("%OUTPUT_FILE%") do echo File size: %%~zA bytes
-    ) else (
-        echo.
-        echo WARNING: Output file not found at expected location.
-        echo Check log for actual output path or errors.
+    for %%F in (%OUTPUT_FILES%) do (
+        if exist %%F (
+            echo.
+            echo Decompiled output written to:
+            echo   %%~F
+            echo File size: %%~zF bytes
+        ) else (
+            echo.
+            echo WARNING: Output file not found at expected location: %%~F
+            echo Check log for actual output path or errors.
+        )
     )
 ) else (
     echo Analysis failed with exit code %EXIT_CODE%